@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+JSON Decode Benchmark
+
+This script compares the time taken to decode search responses per 1000 issues
+with each ResponseDecoder configuration, and the size of the decoded results that
+are kept with and without pruning.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import ResponseDecoder
+
+
+def make_search_page(issue_count, comments_per_issue, extra_fields=0):
+    """
+    Build a synthetic search response shaped like /rest/api/2/search output
+    
+    extra_fields adds custom fields beyond summary/status/comment, as returned when
+    a search asks for more fields than the caller ends up using.
+    """
+    issues = []
+    for i in range(issue_count):
+        comments = [
+            {
+                "id": str(c),
+                "author": {"displayName": f"User {c}", "name": f"user{c}"},
+                "body": "This is a comment body with some text in it. " * 5,
+                "created": "2024-01-01T10:00:00.000+0000",
+                "updated": "2024-01-01T10:00:00.000+0000",
+            }
+            for c in range(comments_per_issue)
+        ]
+        fields = {
+            "summary": f"Issue number {i}",
+            "status": {"name": "In Progress", "id": "3"},
+            "comment": {"comments": comments, "maxResults": comments_per_issue,
+                        "total": comments_per_issue, "startAt": 0},
+        }
+        for f in range(extra_fields):
+            fields[f"customfield_{10000 + f}"] = {"value": "Some custom field value " * 4, "id": str(f)}
+        issues.append({
+            "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+            "id": str(10000 + i),
+            "self": f"https://jira.example.com/rest/api/2/issue/{10000 + i}",
+            "key": f"PROJ-{i}",
+            "fields": fields,
+        })
+    page = {"startAt": 0, "maxResults": issue_count, "total": issue_count, "issues": issues}
+    return json.dumps(page).encode("utf-8")
+
+
+class FakeRaw(io.BytesIO):
+    """Stand-in for urllib3's raw response stream"""
+    decode_content = False
+
+
+class FakeResponse:
+    """Stand-in for a requests response holding a JSON body"""
+    
+    def __init__(self, body):
+        self.body = body
+    
+    @property
+    def content(self):
+        return self.body
+    
+    @property
+    def raw(self):
+        return FakeRaw(self.body)
+    
+    def json(self):
+        # Mirror requests: bytes are decoded to text before parsing
+        return json.loads(self.body.decode("utf-8"))
+
+
+def time_decode(decode, response, repeat):
+    """Return the best time in seconds for a single decode"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(response)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoding of search responses")
+    parser.add_argument("--issues", type=int, default=1000, help="Issues per page (default: 1000)")
+    parser.add_argument("--comments", type=int, default=5, help="Comments per issue (default: 5)")
+    parser.add_argument("--extra-fields", type=int, default=20,
+                        help="Unused custom fields per issue, for the pruning comparison (default: 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per decoder (default: 5)")
+    args = parser.parse_args()
+    
+    fields = ["summary", "status", "comment"]
+    
+    # Decoding the fields that were requested
+    body = make_search_page(args.issues, args.comments)
+    response = FakeResponse(body)
+    candidates = [("response.json()", lambda r: r.json())]
+    for use_fast in (False, True):
+        for stream in (False, True):
+            decoder = ResponseDecoder(use_fast=use_fast, stream=stream)
+            if use_fast and decoder.name != "orjson":
+                continue
+            label = f"{decoder.name}{' (stream)' if stream else ''}"
+            candidates.append((label, lambda r, d=decoder: d.decode(r, fields)))
+    
+    print(f"Payload: {args.issues} issues, {args.comments} comments each, {len(body) / 1024:.0f} KiB")
+    print(f"{'Decoder':<20} {'ms/1000 issues':>15}")
+    for label, decode in candidates:
+        seconds = time_decode(decode, response, args.repeat)
+        print(f"{label:<20} {seconds * 1000 * 1000 / args.issues:>15.2f}")
+    
+    # Pruning fields that came back but aren't used: a post-filter that costs time
+    # and saves the memory held by the results
+    extra_body = make_search_page(args.issues, args.comments, args.extra_fields)
+    extra_response = FakeResponse(extra_body)
+    print()
+    print(f"Payload: {args.issues} issues with {args.extra_fields} unused fields each, "
+          f"{len(extra_body) / 1024:.0f} KiB")
+    print(f"{'Decoder':<20} {'ms/1000 issues':>15} {'KiB kept':>10}")
+    for prune in (False, True):
+        decoder = ResponseDecoder(prune=prune)
+        label = f"{decoder.name}{' + prune' if prune else ''}"
+        seconds = time_decode(lambda r: decoder.decode(r, fields), extra_response, args.repeat)
+        kept = len(json.dumps(decoder.decode(extra_response, fields)))
+        print(f"{label:<20} {seconds * 1000 * 1000 / args.issues:>15.2f} {kept / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,29 @@ This module provides the command-line interface for searching Jira issues.
 
 import argparse
 import json
+import math
+import re
+import requests
+import subprocess
 import sys
+import tempfile
 import os
+import time
 import yaml
 from typing import Dict, List, Any, Optional
 
-from core import JiraInterface
+from core import (JiraInterface, ResponseDecoder, SearchCache, QueryUsage, Prefetcher, IssueExporter,
+                  LoadTest, StubJiraServer)
+
+# Fields requested by watch mode; "updated" is what change detection is based on
+WATCH_FIELDS = ["summary", "status", "updated"]
+
+# Tracked issues re-checked per request by watch mode; the JQL goes in the POST
+# body, so large batches only cost a longer query string
+WATCH_KEY_BATCH = 1000
+
+# Seconds a search waits for an in-flight prefetch of the same query
+PREFETCH_WAIT = 10
 
 
 def load_queries(file_path):
@@ -28,12 +45,20 @@ def load_queries(file_path):
         return []
 
 
+def find_query(queries, name):
+    """Find a named query in the loaded queries"""
+    for query in queries:
+        if query['name'] == name:
+            return query
+    return None
+
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Jira Search Interface")
     
-    # Main action argument - only search is supported
-    parser.add_argument("action", choices=["search"], help="Action to perform")
+    # Main action argument
+    parser.add_argument("action", choices=["search", "watch", "prefetch", "loadtest"], help="Action to perform")
     
     # Search-specific arguments
     parser.add_argument("--query", "-q", help="Name of the query to use from jira_queries.yaml")
@@ -42,6 +67,45 @@ def parse_args():
                         help="Output format (default: summary)")
     parser.add_argument("--limit", "-l", type=int, default=10, help="Maximum number of results to return")
     parser.add_argument("--list-queries", action="store_true", help="List available queries and exit")
+    parser.add_argument("--stream", action="store_true",
+                        help="Decode search responses straight from the response stream")
+    
+    # Export arguments
+    parser.add_argument("--output", "-o",
+                        help="Export all matching issues to this JSON Lines file, page by page")
+    parser.add_argument("--page-size", type=int, default=100,
+                        help="Issues per page when exporting or watching (default: 100)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted export from its checkpoint")
+    
+    # Watch-specific arguments
+    parser.add_argument("--interval", "-i", type=int, default=60,
+                        help="Seconds between polls in watch mode (default: 60)")
+    
+    # Prefetch arguments
+    parser.add_argument("--prefetch", action="store_true",
+                        help="Use cached results and warm the cache for the queries likely to follow")
+    parser.add_argument("--prefetch-budget", type=int, default=2,
+                        help="Maximum number of requests a prefetch may make (default: 2)")
+    parser.add_argument("--cache-ttl", type=int, default=300,
+                        help="Seconds cached results stay fresh (default: 300)")
+    
+    # Load test arguments
+    parser.add_argument("--queries", help="Comma-separated named queries to replay in load tests "
+                                          "(default: all queries)")
+    parser.add_argument("--workers", "-w", type=int, default=4,
+                        help="Concurrent workers in load tests (default: 4)")
+    parser.add_argument("--requests", "-n", type=int, default=100,
+                        help="Total searches to send in load tests (default: 100)")
+    parser.add_argument("--base-url", help="Jira base URL to load test (default: the configured URL)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Serve load test searches through a fresh search cache (see --cache-ttl)")
+    parser.add_argument("--stub", action="store_true",
+                        help="Load test a local stand-in server instead of Jira")
+    parser.add_argument("--stub-latency", type=float, default=50,
+                        help="Response latency of the stand-in server in ms (default: 50)")
+    parser.add_argument("--stub-throttle-rate", type=float, default=0.0,
+                        help="Fraction of stand-in server responses that are 429s (default: 0.0)")
     
     return parser.parse_args()
 
@@ -75,14 +139,12 @@ def handle_search(jira, args):
         print(f"Using custom JQL query: {jql}")
     elif args.query:
         # Find the named query in the loaded queries
-        for query in queries:
-            if query['name'] == args.query:
-                jql = query['jql']
-                print(f"Using query '{query['name']}': {query['description']}")
-                print(f"JQL: {jql}")
-                break
-        
-        if not jql:
+        query = find_query(queries, args.query)
+        if query:
+            jql = query['jql']
+            print(f"Using query '{query['name']}': {query['description']}")
+            print(f"JQL: {jql}")
+        else:
             print(f"Error: Query '{args.query}' not found in {queries_file}")
             return None
     else:
@@ -96,10 +158,288 @@ def handle_search(jira, args):
             print(f"Error: No queries found in {queries_file}")
             return None
     
+    if args.output:
+        return handle_export(jira, args, jql)
+    if args.resume:
+        print("Error: --resume requires --output")
+        return None
+    
+    # Serve the results from the cache if a prefetch already fetched them
+    if args.prefetch:
+        cache = SearchCache(ttl=args.cache_ttl)
+        key = cache.key(jira.base_url, jql, args.limit)
+        entry = cache.get(key)
+        # Wait briefly for a background prefetch of this query rather than duplicating it
+        if not entry and cache.is_pending(key):
+            print("Waiting for a prefetch of this query to finish...")
+            entry = cache.wait(key, PREFETCH_WAIT)
+        if entry:
+            print(f"Using cached results from {int(time.time() - entry['stored_at'])}s ago")
+            return entry['results']
+        
+        # Cache our own results too, so repeating the query within the TTL is free
+        try:
+            results = jira.search_issues(jql, max_results=args.limit, raise_on_error=True)
+        except requests.HTTPError as e:
+            print(f"Error: {e.response.status_code}")
+            print(e.response.text)
+            return None
+        cache.put(key, results)
+        return results
+    
     # Search for issues using the selected JQL query
     return jira.search_issues(jql, max_results=args.limit)
 
 
+def handle_export(jira, args, jql):
+    """Export all issues matching the JQL query to the output file"""
+    exporter = IssueExporter(jira, args.output, page_size=args.page_size)
+    
+    if args.resume:
+        checkpoint = exporter.load_checkpoint()
+        if checkpoint:
+            print(f"Resuming export at issue {checkpoint['next_start_at']} of {checkpoint['total']}")
+    
+    def report(state):
+        print(f"Exported {state['next_start_at']} of {state['total']} issues")
+    
+    try:
+        count = exporter.export(jql, resume=args.resume, progress=report)
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        # Checked before ValueError, which JSONDecodeError subclasses
+        print(f"Error: {str(e)}")
+        if exporter.load_checkpoint():
+            print(f"Export interrupted; rerun with --resume to continue from {exporter.checkpoint_path}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+    
+    print(f"Export complete: {count} issues written to {args.output}")
+    return None
+
+
+def start_prefetch(args):
+    """Record the named query and warm the cache in a detached background process"""
+    QueryUsage().record(args.query)
+    
+    # A separate session lets the prefetch outlive this process without delaying exit
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(sys.argv[0]), "prefetch",
+         "--query", args.query,
+         "--limit", str(args.limit),
+         "--prefetch-budget", str(args.prefetch_budget),
+         "--cache-ttl", str(args.cache_ttl)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def handle_prefetch(jira, args):
+    """Handle the prefetch action"""
+    if not args.query:
+        print("Error: prefetch requires --query")
+        return None
+    
+    # Run at low priority so foreground searches always win
+    if hasattr(os, 'nice'):
+        os.nice(10)
+    
+    queries_file = os.environ.get('JIRA_QUERIES_PATH', os.path.join('data', 'jira_queries.yaml'))
+    queries = load_queries(queries_file)
+    
+    prefetcher = Prefetcher(jira, SearchCache(ttl=args.cache_ttl), QueryUsage(),
+                            budget=args.prefetch_budget)
+    fetched = prefetcher.warm(args.query, queries, max_results=args.limit)
+    print(f"Prefetched: {', '.join(fetched) if fetched else 'nothing'}")
+    return None
+
+
+def incremental_jql(jql, minutes):
+    """Restrict a JQL query to issues updated in the last number of minutes"""
+    # Keep any ORDER BY clause outside the parentheses so the query stays valid
+    match = re.search(r'\s+ORDER\s+BY\s+', jql, re.IGNORECASE)
+    order_by = ""
+    if match:
+        jql, order_by = jql[:match.start()], jql[match.start():]
+    return f'({jql}) AND updated >= "-{minutes}m"{order_by}'
+
+
+def updated_keys_jql(keys, minutes):
+    """Select the given issues if they were updated in the last number of minutes"""
+    return f'key in ({", ".join(keys)}) AND updated >= "-{minutes}m"'
+
+
+def fetch_watch_issues(jira, jql, page_size, validate_query=None):
+    """Fetch every issue matching a query with the watch fields, page by page"""
+    issues = []
+    while True:
+        results = jira.search_issues(jql, max_results=page_size, fields=list(WATCH_FIELDS),
+                                     include_comments=False, start_at=len(issues),
+                                     raise_on_error=True, validate_query=validate_query)
+        page = results.get('issues', [])
+        issues.extend(page)
+        if not page or len(issues) >= results.get('total', 0):
+            return issues
+
+
+def snapshot_issues(issues):
+    """Reduce search results to a snapshot keyed by issue key"""
+    snapshot = {}
+    for issue in issues:
+        fields = issue.get('fields', {})
+        snapshot[issue.get('key', 'Unknown')] = {
+            'summary': fields.get('summary', 'No summary'),
+            'status': (fields.get('status') or {}).get('name', 'Unknown'),
+            'updated': fields.get('updated', ''),
+        }
+    return snapshot
+
+
+def diff_snapshots(previous, current, removed=None):
+    """Compare a poll against the previous snapshot and describe what changed"""
+    changes = []
+    for key, state in current.items():
+        old = previous.get(key)
+        if old is None:
+            changes.append(f"  + {key}: {state['summary']} (Status: {state['status']})")
+        elif old['updated'] != state['updated']:
+            details = []
+            if old['status'] != state['status']:
+                details.append(f"status {old['status']} -> {state['status']}")
+            if old['summary'] != state['summary']:
+                details.append(f"summary was '{old['summary']}'")
+            changes.append(f"  ~ {key}: {state['summary']} ({', '.join(details) or 'updated'})")
+    
+    # Issues that were updated but no longer match the query have left it
+    for key, state in (removed or {}).items():
+        if key in previous and key not in current:
+            changes.append(f"  - {key}: {state['summary']} (Status: {state['status']})")
+    return changes
+
+
+def handle_watch(jira, args):
+    """Handle the watch action"""
+    queries_file = os.environ.get('JIRA_QUERIES_PATH', os.path.join('data', 'jira_queries.yaml'))
+    queries = load_queries(queries_file)
+    
+    if not args.query:
+        print("Error: watch requires --query")
+        return None
+    query = find_query(queries, args.query)
+    if not query:
+        print(f"Error: Query '{args.query}' not found in {queries_file}")
+        return None
+    
+    jql = query['jql']
+    print(f"Watching query '{query['name']}' every {args.interval}s (Ctrl+C to stop)")
+    print(f"JQL: {jql}")
+    
+    # The first poll fetches the full result set to seed the snapshot
+    last_poll = time.time()
+    snapshot = snapshot_issues(fetch_watch_issues(jira, jql, args.page_size))
+    print(f"Tracking {len(snapshot)} issues")
+    
+    try:
+        while True:
+            time.sleep(args.interval)
+            
+            # Only ask for issues updated since the last successful poll, with a minute
+            # of overlap since JQL date filters have minute granularity
+            poll_start = time.time()
+            minutes = math.ceil((poll_start - last_poll) / 60) + 1
+            try:
+                # Check the tracked issues first, so anything updated in between the two
+                # searches shows up in the query results rather than as a removal.
+                # Tracked issues may since have been deleted or hidden, which Jira
+                # rejects in a key list unless the query is only validated with warnings
+                keys = list(snapshot)
+                updated = {}
+                for i in range(0, len(keys), WATCH_KEY_BATCH):
+                    updated.update(snapshot_issues(fetch_watch_issues(
+                        jira, updated_keys_jql(keys[i:i + WATCH_KEY_BATCH], minutes),
+                        args.page_size, validate_query="warn")))
+                current = snapshot_issues(fetch_watch_issues(
+                    jira, incremental_jql(jql, minutes), args.page_size))
+            except requests.RequestException as e:
+                print(f"[{time.strftime('%H:%M:%S')}] Poll failed, retrying next interval: {str(e)}")
+                continue
+            last_poll = poll_start
+            
+            removed = {key: state for key, state in updated.items() if key not in current}
+            changes = diff_snapshots(snapshot, current, removed)
+            if changes:
+                print(f"[{time.strftime('%H:%M:%S')}] {len(changes)} change(s):")
+                print("\n".join(changes))
+            snapshot.update(current)
+            for key in removed:
+                snapshot.pop(key, None)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    
+    return None
+
+
+def handle_loadtest(args):
+    """Handle the loadtest action"""
+    queries_file = os.environ.get('JIRA_QUERIES_PATH', os.path.join('data', 'jira_queries.yaml'))
+    queries = load_queries(queries_file)
+    
+    # Build the workload from the named queries, in the order given
+    if args.queries:
+        workload = []
+        for name in args.queries.split(','):
+            query = find_query(queries, name.strip())
+            if not query:
+                print(f"Error: Query '{name.strip()}' not found in {queries_file}")
+                return None
+            workload.append(query['jql'])
+    else:
+        workload = [query['jql'] for query in queries]
+    if not workload:
+        print(f"Error: No queries found in {queries_file}")
+        return None
+    
+    stub = None
+    if args.stub:
+        stub = StubJiraServer(latency=args.stub_latency / 1000, throttle_rate=args.stub_throttle_rate)
+        stub.start()
+        jira = JiraInterface(base_url=stub.base_url,
+                             api_token=os.environ.get("JIRA_API_TOKEN") or "stub-token",
+                             decoder=ResponseDecoder(stream=args.stream))
+    else:
+        jira = JiraInterface(base_url=args.base_url, decoder=ResponseDecoder(stream=args.stream))
+    
+    print(f"Load testing {jira.base_url} with {args.workers} workers, "
+          f"{args.requests} requests over {len(workload)} queries")
+    
+    # Use a throwaway cache so the run starts cold and leaves the real cache alone
+    cache_dir = tempfile.TemporaryDirectory() if args.cache else None
+    cache = SearchCache(cache_dir=cache_dir.name, ttl=args.cache_ttl) if cache_dir else None
+    
+    try:
+        report = LoadTest(jira, workload, workers=args.workers, max_results=args.limit,
+                          cache=cache).run(args.requests)
+    finally:
+        if stub:
+            stub.stop()
+        if cache_dir:
+            cache_dir.cleanup()
+    
+    print(f"Duration:      {report['duration']:.2f}s")
+    print(f"Throughput:    {report['throughput']:.1f} req/s")
+    print(f"Latency p50:   {report['p50'] * 1000:.1f} ms")
+    print(f"Latency p95:   {report['p95'] * 1000:.1f} ms")
+    print(f"Latency p99:   {report['p99'] * 1000:.1f} ms")
+    print(f"Error rate:    {report['error_rate']:.1%}")
+    print(f"Throttle rate: {report['throttle_rate']:.1%}")
+    if cache:
+        print(f"Cache hit rate: {report['cache_hit_rate']:.1%} (TTL {args.cache_ttl}s)")
+    return None
+
+
 def format_search_results(results, format_type):
     """Format search results based on the specified format"""
     if not results:
@@ -156,10 +496,22 @@ def main():
     args = parse_args()
     
     try:
-        jira = JiraInterface()
+        if args.action == "loadtest":
+            handle_loadtest(args)
+            return
+        
+        jira = JiraInterface(decoder=ResponseDecoder(stream=args.stream))
+        if args.action == "watch":
+            handle_watch(jira, args)
+            return
+        if args.action == "prefetch":
+            handle_prefetch(jira, args)
+            return
         result = handle_search(jira, args)
         if result:
             print(format_search_results(result, args.format))
+            if args.prefetch and args.query:
+                start_prefetch(args)
     
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -4,6 +4,11 @@ Core Jira Interface Module
 This module provides the core functionality for interacting with Jira's REST API.
 """
 
-from core.interface import JiraInterface
+from core.interface import JiraInterface, ResponseDecoder
+from core.cache import SearchCache
+from core.prefetch import QueryUsage, Prefetcher
+from core.export import IssueExporter
+from core.loadtest import LoadTest, StubJiraServer
 
-__all__ = ['JiraInterface'] 
\ No newline at end of file
+__all__ = ['JiraInterface', 'ResponseDecoder', 'SearchCache', 'QueryUsage', 'Prefetcher',
+           'IssueExporter', 'LoadTest', 'StubJiraServer'] 
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+Search Result Cache Module
+
+This module provides a small on-disk cache for search results, so results can be
+reused across separate invocations of the CLI.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Any, Optional
+
+
+def default_cache_dir() -> str:
+    """Return the cache directory (JIRA_CACHE_DIR, or ~/.cache/jira-cli)"""
+    return os.environ.get("JIRA_CACHE_DIR",
+                          os.path.join(os.path.expanduser("~"), ".cache", "jira-cli"))
+
+
+def write_private_json(path: str, data: Any) -> None:
+    """
+    Atomically write JSON readable only by the current user
+    
+    Args:
+        path: File to write
+        data: JSON-serializable data
+    """
+    # Cached issues and query history shouldn't be readable by other users
+    os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+    
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as file:
+        json.dump(data, file)
+    os.replace(tmp_path, path)
+
+
+class SearchCache:
+    """
+    File-based cache of search results with a time-to-live.
+    """
+    
+    def __init__(self, cache_dir: str = None, ttl: int = 300, pending_timeout: int = 60):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory to store entries in (defaults to default_cache_dir())
+            ttl: Seconds an entry stays fresh (default: 300)
+            pending_timeout: Seconds after which an in-flight marker is considered
+                abandoned (default: 60)
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.ttl = ttl
+        self.pending_timeout = pending_timeout
+    
+    def key(self, base_url: str, jql: str, max_results: int, fields: List[str] = None) -> str:
+        """
+        Build the cache key for a search
+        
+        Args:
+            base_url: Jira base URL the search runs against
+            jql: JQL query string
+            max_results: Maximum number of results requested
+            fields: Fields requested (None for the defaults)
+            
+        Returns:
+            Hex digest identifying the search
+        """
+        raw = json.dumps([base_url, jql, max_results, fields])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, "search", f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh cache entry
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            Dict with 'stored_at' and 'results', or None if missing or stale
+        """
+        try:
+            with open(self._path(key), "r") as file:
+                entry = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+        
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            return None
+        return entry
+    
+    def put(self, key: str, results: Dict[str, Any]) -> None:
+        """
+        Store search results
+        
+        Args:
+            key: Cache key from key()
+            results: Search results to store
+        """
+        write_private_json(self._path(key), {"stored_at": time.time(), "results": results})
+    
+    def mark_pending(self, key: str) -> bool:
+        """
+        Mark a search as being fetched, so other processes can wait for it
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            True if the marker was created, False if another fetch is already in flight
+        """
+        path = self._path(key) + ".pending"
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        
+        # Markers left behind by a crashed fetch expire after pending_timeout
+        try:
+            if time.time() - os.path.getmtime(path) > self.pending_timeout:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+        except FileExistsError:
+            return False
+        return True
+    
+    def clear_pending(self, key: str) -> None:
+        """
+        Remove the in-flight marker for a search
+        
+        Args:
+            key: Cache key from key()
+        """
+        try:
+            os.remove(self._path(key) + ".pending")
+        except FileNotFoundError:
+            pass
+    
+    def is_pending(self, key: str) -> bool:
+        """
+        Check whether a search is being fetched by another process
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            True if an unexpired in-flight marker exists
+        """
+        try:
+            return time.time() - os.path.getmtime(self._path(key) + ".pending") <= self.pending_timeout
+        except FileNotFoundError:
+            return False
+    
+    def wait(self, key: str, timeout: float, interval: float = 0.1) -> Optional[Dict[str, Any]]:
+        """
+        Wait for an in-flight fetch of a search to finish
+        
+        Args:
+            key: Cache key from key()
+            timeout: Maximum number of seconds to wait
+            interval: Seconds between checks (default: 0.1)
+            
+        Returns:
+            The fresh cache entry, or None if there is none once the fetch finished
+            or the timeout expired
+        """
+        deadline = time.time() + timeout
+        while self.is_pending(key) and time.time() < deadline:
+            time.sleep(interval)
+        return self.get(key)
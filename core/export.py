@@ -0,0 +1,166 @@
+"""
+Checkpointed Export Module
+
+This module exports all issues matching a JQL query to a JSON Lines file, page by
+page, recording progress in a checkpoint file so an interrupted export can resume.
+"""
+
+import json
+import os
+import re
+from typing import Callable, Dict, List, Any, Optional
+
+
+# Issues created during an export sort after everything already exported, so
+# offset pagination neither skips nor repeats them
+EXPORT_ORDER = "ORDER BY created ASC, key ASC"
+
+
+def stable_order_jql(jql: str) -> str:
+    """
+    Replace any ORDER BY clause in a JQL query with the export order
+    
+    Args:
+        jql: JQL query string
+        
+    Returns:
+        The JQL query ordered by EXPORT_ORDER
+    """
+    match = re.search(r'\s+ORDER\s+BY\s+', jql, re.IGNORECASE)
+    if match:
+        jql = jql[:match.start()]
+    return f"{jql} {EXPORT_ORDER}"
+
+
+class IssueExporter:
+    """
+    Exports search results to a JSON Lines file with resumable checkpoints.
+    """
+    
+    def __init__(self, jira, output_path: str, page_size: int = 100):
+        """
+        Initialize the exporter.
+        
+        Args:
+            jira: JiraInterface used to run searches
+            output_path: JSON Lines file to write issues to
+            page_size: Number of issues to request per page (default: 100)
+        """
+        self.jira = jira
+        self.output_path = output_path
+        self.page_size = page_size
+    
+    @property
+    def checkpoint_path(self) -> str:
+        """Path of the checkpoint file kept next to the output file"""
+        return f"{self.output_path}.checkpoint"
+    
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpoint of an interrupted export
+        
+        Returns:
+            Dict with the export's jql, fields, next_start_at, offset and total,
+            or None if there is no checkpoint
+        """
+        try:
+            with open(self.checkpoint_path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+    
+    def _save_checkpoint(self, state: Dict[str, Any]) -> None:
+        # Replace the checkpoint atomically so a crash never leaves it half written
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+    
+    def export(self, jql: str, fields: List[str] = None, resume: bool = False,
+               progress: Callable[[Dict[str, Any]], None] = None) -> int:
+        """
+        Export all issues matching a JQL query
+        
+        Each page is appended and synced to the output file before the checkpoint
+        is advanced past it. On resume, anything written after the last checkpoint
+        is truncated away, so a page is either fully in the output or not at all.
+        
+        Pages are fetched by offset, so the query's own ORDER BY is replaced with
+        EXPORT_ORDER (oldest first) and the ordered JQL is recorded in the
+        checkpoint. Issues created during the export land after the cursor; an
+        issue deleted before the cursor still shifts later pages by one, skipping
+        one issue.
+        
+        Args:
+            jql: JQL query string
+            fields: List of fields to include (default: the search_issues defaults)
+            resume: Continue from the existing checkpoint (default: False)
+            progress: Called with the checkpoint state after each page
+            
+        Returns:
+            Number of issues in the output file
+            
+        Raises:
+            ValueError: If resuming without a matching checkpoint, or the output
+                file no longer holds the pages the checkpoint records
+            requests.RequestException: If a page request fails
+            json.JSONDecodeError: If a page response is not valid JSON
+        """
+        jql = stable_order_jql(jql)
+        
+        if resume:
+            state = self.load_checkpoint()
+            if state is None:
+                raise ValueError(f"No checkpoint found at {self.checkpoint_path}")
+            if state["jql"] != jql or state["fields"] != fields:
+                raise ValueError(f"Checkpoint {self.checkpoint_path} was created for a different "
+                                 f"query: {state['jql']}")
+            # The checkpoint is only valid if every page it records is still on disk
+            try:
+                size = os.path.getsize(self.output_path)
+            except FileNotFoundError:
+                raise ValueError(f"Output file {self.output_path} is missing; "
+                                 f"restart the export without --resume")
+            if size < state["offset"]:
+                raise ValueError(f"Output file {self.output_path} is shorter than its checkpoint; "
+                                 f"restart the export without --resume")
+            mode = "r+b"
+        else:
+            state = {"jql": jql, "fields": fields, "next_start_at": 0, "offset": 0, "total": None}
+            mode = "wb"
+        
+        with open(self.output_path, mode) as output:
+            # Drop any partially written page from the interrupted run
+            output.truncate(state["offset"])
+            output.seek(state["offset"])
+            
+            while state["total"] is None or state["next_start_at"] < state["total"]:
+                results = self.jira.search_issues(
+                    jql,
+                    max_results=self.page_size,
+                    fields=list(fields) if fields is not None else None,
+                    start_at=state["next_start_at"],
+                    raise_on_error=True,
+                )
+                issues = results.get("issues", [])
+                if not issues:
+                    break
+                
+                output.write(b"".join(json.dumps(issue).encode("utf-8") + b"\n" for issue in issues))
+                output.flush()
+                os.fsync(output.fileno())
+                
+                state["next_start_at"] += len(issues)
+                state["offset"] = output.tell()
+                state["total"] = results.get("total", 0)
+                self._save_checkpoint(state)
+                
+                if progress:
+                    progress(state)
+        
+        # The export is complete, so there is nothing left to resume
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return state["next_start_at"]
@@ -11,18 +11,117 @@ import os
 import sys
 from typing import Dict, List, Any, Optional, Union
 
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ResponseDecoder:
+    """
+    Decodes JSON response bodies, using orjson when it is available.
+    """
+    
+    def __init__(self, use_fast: bool = True, stream: bool = False, prune: bool = False):
+        """
+        Initialize the decoder.
+        
+        Args:
+            use_fast: Use orjson if it is installed (default: True)
+            stream: Request a streamed response and decode straight from the raw byte
+                stream, bypassing requests' text decoding (default: False)
+            prune: After decoding, drop issue keys and fields that were not requested.
+                This adds a little CPU to reduce the memory held by the results; it does
+                not make decoding faster (default: False)
+        """
+        self.use_fast = use_fast and orjson is not None
+        self.stream = stream
+        self.prune = prune
+    
+    @property
+    def name(self) -> str:
+        """Name of the JSON library in use"""
+        return "orjson" if self.use_fast else "json"
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document
+        
+        Args:
+            data: JSON document as bytes or str
+            
+        Returns:
+            The decoded document
+        """
+        if self.use_fast:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def decode(self, response, fields: List[str] = None) -> Any:
+        """
+        Decode the body of a response
+        
+        Args:
+            response: A requests response, streamed if this decoder was created with stream=True
+            fields: Issue fields to keep when pruning (default: keep everything)
+            
+        Returns:
+            The decoded response body
+        """
+        if self.stream:
+            # Let urllib3 undo any gzip/deflate encoding while we read
+            response.raw.decode_content = True
+            if self.use_fast:
+                data = orjson.loads(response.raw.read())
+            else:
+                data = json.load(response.raw)
+        else:
+            data = self.loads(response.content)
+        
+        if self.prune and fields is not None:
+            data = self.prune_issues(data, fields)
+        return data
+    
+    @staticmethod
+    def prune_issues(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+        """
+        Strip search results down to the issue key, id and the requested fields
+        
+        This is a post-filter on already decoded results, for callers that keep
+        many results around; the fields sent in the search request are what
+        limit how much is transferred and decoded.
+        
+        Args:
+            data: Decoded search results
+            fields: Issue fields to keep
+            
+        Returns:
+            The pruned search results
+        """
+        keep = set(fields)
+        issues = []
+        for issue in data.get("issues", []):
+            pruned = {k: issue[k] for k in ("id", "key") if k in issue}
+            pruned["fields"] = {k: v for k, v in issue.get("fields", {}).items() if k in keep}
+            issues.append(pruned)
+        data["issues"] = issues
+        return data
+
+
 class JiraInterface:
     """
     Main class for interacting with the Jira API.
     """
     
-    def __init__(self, base_url=None, api_token=None):
+    def __init__(self, base_url=None, api_token=None, decoder=None):
         """
         Initialize the Jira Interface.
         
         Args:
             base_url: Jira base URL (defaults to JIRA_URL env var)
             api_token: Jira API token (defaults to JIRA_API_TOKEN env var)
+            decoder: ResponseDecoder used for search responses (defaults to ResponseDecoder())
         """
         # Get configuration from environment variables
         # Use the provided parameters first, then fall back to environment variables
@@ -43,6 +142,8 @@ class JiraInterface:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_token}"
         }
+        
+        self.decoder = decoder or ResponseDecoder()
     
     def get_current_user(self) -> Optional[Dict[str, Any]]:
         """
@@ -80,7 +181,9 @@ class JiraInterface:
         # For brevity, we're just returning an empty list for now
         return []
     
-    def search_issues(self, jql: str, max_results: int = 50, fields: List[str] = None) -> Dict[str, Any]:
+    def search_issues(self, jql: str, max_results: int = 50, fields: List[str] = None,
+                      include_comments: bool = True, start_at: int = 0,
+                      raise_on_error: bool = False, validate_query: str = None) -> Dict[str, Any]:
         """
         Search for issues using JQL (Jira Query Language)
         
@@ -88,6 +191,12 @@ class JiraInterface:
             jql: JQL query string
             max_results: Maximum number of results to return (default: 50)
             fields: List of fields to include in the response (default: all fields)
+            include_comments: Whether to always request the comment field (default: True)
+            start_at: Index of the first result to return, for pagination (default: 0)
+            raise_on_error: Raise requests.HTTPError on a failed request instead of
+                returning empty results (default: False)
+            validate_query: Jira's validateQuery mode, e.g. "warn" to return warnings
+                instead of a 400 for references to missing issues (default: server default)
             
         Returns:
             Dictionary containing search results with issues and pagination info
@@ -96,23 +205,28 @@ class JiraInterface:
         
         # Default fields to include if none specified
         if fields is None:
-            fields = ["summary", "status", "comment"]
-        elif "comment" not in fields:
+            fields = ["summary", "status", "comment"] if include_comments else ["summary", "status"]
+        elif include_comments and "comment" not in fields:
             fields.append("comment")
         
         # Prepare the request payload
         payload = {
             "jql": jql,
             "maxResults": max_results,
-            "startAt": 0,
+            "startAt": start_at,
             "fields": fields
         }
+        if validate_query is not None:
+            payload["validateQuery"] = validate_query
         
         # Make the API request
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = requests.post(url, headers=self.headers, json=payload, stream=self.decoder.stream)
         
         if response.status_code == 200:
-            return response.json()
+            return self.decoder.decode(response, fields)
+        elif raise_on_error:
+            raise requests.HTTPError(f"Search failed with status {response.status_code}",
+                                     response=response)
         else:
             print(f"Error: {response.status_code}")
             print(response.text)
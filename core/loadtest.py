@@ -0,0 +1,212 @@
+"""
+Load Test Module
+
+This module replays a workload of JQL queries against a Jira instance with
+concurrent workers and summarizes throughput, latency, errors and throttling. It
+also provides a local stand-in Jira server to run load tests against.
+"""
+
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any
+
+import requests
+
+from core.cache import SearchCache
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list
+    
+    Args:
+        sorted_values: Values sorted in ascending order
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadTest:
+    """
+    Replays a workload of searches through a JiraInterface with concurrent workers.
+    """
+    
+    def __init__(self, jira, workload: List[str], workers: int = 4, max_results: int = 10,
+                 cache: SearchCache = None):
+        """
+        Initialize the load test.
+        
+        Args:
+            jira: JiraInterface to send searches through
+            workload: JQL queries to replay, in order, cycling as needed
+            workers: Number of concurrent workers (default: 4)
+            max_results: Maximum number of results per search (default: 10)
+            cache: SearchCache to serve searches through, as search --prefetch does
+                (default: no cache)
+        """
+        self.jira = jira
+        self.workload = workload
+        self.workers = workers
+        self.max_results = max_results
+        self.cache = cache
+    
+    def _run_one(self, jql: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        outcome = "ok"
+        cached = False
+        try:
+            if self.cache:
+                key = self.cache.key(self.jira.base_url, jql, self.max_results)
+                cached = self.cache.get(key) is not None
+                if not cached:
+                    results = self.jira.search_issues(jql, max_results=self.max_results,
+                                                      raise_on_error=True)
+                    self.cache.put(key, results)
+            else:
+                self.jira.search_issues(jql, max_results=self.max_results, raise_on_error=True)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            outcome = "throttled" if status == 429 else "error"
+        except (requests.RequestException, ValueError):
+            # ValueError covers 200 responses that aren't JSON, such as an SSO login page
+            outcome = "error"
+        return {"latency": time.perf_counter() - start, "outcome": outcome, "cached": cached}
+    
+    def run(self, requests_total: int) -> Dict[str, Any]:
+        """
+        Run the load test
+        
+        Args:
+            requests_total: Total number of searches to send
+            
+        Returns:
+            Dict with requests, duration, throughput, error_rate, throttle_rate,
+            cache_hit_rate and p50/p95/p99 latencies in seconds
+        """
+        queries = itertools.islice(itertools.cycle(self.workload), requests_total)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            samples = list(executor.map(self._run_one, queries))
+        duration = time.perf_counter() - start
+        
+        return self.summarize(samples, duration)
+    
+    @staticmethod
+    def summarize(samples: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+        """
+        Summarize load test samples
+        
+        Args:
+            samples: Dicts with the latency, outcome and, optionally, whether each
+                search was served from the cache
+            duration: Wall-clock duration of the run in seconds
+            
+        Returns:
+            Dict of summary statistics (see run())
+        """
+        total = len(samples)
+        latencies = sorted(sample["latency"] for sample in samples)
+        errors = sum(1 for sample in samples if sample["outcome"] == "error")
+        throttled = sum(1 for sample in samples if sample["outcome"] == "throttled")
+        hits = sum(1 for sample in samples if sample.get("cached"))
+        
+        return {
+            "requests": total,
+            "duration": duration,
+            "throughput": total / duration if duration > 0 else 0.0,
+            "error_rate": errors / total if total else 0.0,
+            "throttle_rate": throttled / total if total else 0.0,
+            "cache_hit_rate": hits / total if total else 0.0,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        }
+
+
+class StubJiraServer:
+    """
+    Local stand-in for the Jira search API, for load testing without a real instance.
+    """
+    
+    def __init__(self, latency: float = 0.05, throttle_rate: float = 0.0, issues: int = 10,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the stub server.
+        
+        Args:
+            latency: Seconds to wait before answering each search (default: 0.05)
+            throttle_rate: Fraction of searches answered with 429 Too Many Requests (default: 0.0)
+            issues: Number of issues returned per search (default: 10)
+            host: Address to listen on (default: 127.0.0.1)
+            port: Port to listen on (default: 0, any free port)
+        """
+        stub = self
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.body = json.dumps({
+            "startAt": 0,
+            "maxResults": issues,
+            "total": issues,
+            "issues": [
+                {"id": str(i), "key": f"STUB-{i}",
+                 "fields": {"summary": f"Stub issue {i}", "status": {"name": "Open"}}}
+                for i in range(issues)
+            ],
+        }).encode("utf-8")
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                time.sleep(stub.latency)
+                
+                if self.path != "/rest/api/2/search":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if random.random() < stub.throttle_rate:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.end_headers()
+                    return
+                
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(stub.body)))
+                self.end_headers()
+                self.wfile.write(stub.body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL to point a JiraInterface at"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> None:
+        """Start serving in a background thread"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+    
+    def stop(self) -> None:
+        """Stop serving"""
+        self.server.shutdown()
+        self.server.server_close()
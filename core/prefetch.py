@@ -0,0 +1,155 @@
+"""
+Query Prefetch Module
+
+This module records which named queries are run and in what order, and warms the
+search cache for the queries most likely to be run next.
+"""
+
+import json
+import os
+from typing import Dict, List, Any
+
+import requests
+
+from core.cache import SearchCache, default_cache_dir, write_private_json
+
+
+class QueryUsage:
+    """
+    Persistent record of named query usage and query-to-query transitions.
+    """
+    
+    def __init__(self, path: str = None):
+        """
+        Initialize the usage record.
+        
+        Args:
+            path: JSON file to store usage in (defaults to query_usage.json in the cache dir)
+        """
+        self.path = path or os.path.join(default_cache_dir(), "query_usage.json")
+        self.data = self._load()
+    
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        data.setdefault("counts", {})
+        data.setdefault("transitions", {})
+        data.setdefault("last", None)
+        return data
+    
+    def record(self, name: str) -> None:
+        """
+        Record that a named query was run
+        
+        Args:
+            name: Name of the query
+        """
+        counts = self.data["counts"]
+        counts[name] = counts.get(name, 0) + 1
+        
+        last = self.data["last"]
+        if last and last != name:
+            following = self.data["transitions"].setdefault(last, {})
+            following[name] = following.get(name, 0) + 1
+        self.data["last"] = name
+        
+        write_private_json(self.path, self.data)
+    
+    def predict(self, after: str, limit: int) -> List[str]:
+        """
+        Predict the queries most likely to follow a query
+        
+        Queries that have followed `after` before come first, ranked by how often;
+        the rest are filled in by overall usage frequency.
+        
+        Args:
+            after: Name of the query that just ran
+            limit: Maximum number of queries to return
+            
+        Returns:
+            List of query names, most likely first
+        """
+        following = self.data["transitions"].get(after, {})
+        ranked = sorted(following, key=lambda name: -following[name])
+        
+        counts = self.data["counts"]
+        for name in sorted(counts, key=lambda name: -counts[name]):
+            if name not in ranked:
+                ranked.append(name)
+        
+        return [name for name in ranked if name != after][:limit]
+
+
+class Prefetcher:
+    """
+    Warms the search cache for the queries most likely to be run next.
+    """
+    
+    def __init__(self, jira, cache: SearchCache, usage: QueryUsage, budget: int = 2):
+        """
+        Initialize the prefetcher.
+        
+        Args:
+            jira: JiraInterface used to run searches
+            cache: SearchCache to warm
+            usage: QueryUsage to predict from
+            budget: Maximum number of requests to make per warm() call (default: 2)
+        """
+        self.jira = jira
+        self.cache = cache
+        self.usage = usage
+        self.budget = budget
+    
+    def warm(self, after: str, queries: List[Dict[str, Any]], max_results: int = 10) -> List[str]:
+        """
+        Warm the cache for the queries likely to follow a query
+        
+        Queries that already have a fresh cache entry, or are already being
+        fetched, are skipped without using any of the request budget. Each fetch
+        is marked in flight so foreground searches can wait for it. Every request
+        counts against the budget, and the first failed request (including a
+        throttled one) ends the prefetch.
+        
+        Args:
+            after: Name of the query that just ran
+            queries: Named queries loaded from the queries file
+            max_results: Maximum number of results per search (default: 10)
+            
+        Returns:
+            Names of the queries that were fetched successfully
+        """
+        by_name = {query['name']: query for query in queries}
+        fetched = []
+        requests_made = 0
+        
+        for name in self.usage.predict(after, len(by_name)):
+            if requests_made >= self.budget:
+                break
+            query = by_name.get(name)
+            if not query:
+                continue
+            
+            key = self.cache.key(self.jira.base_url, query['jql'], max_results)
+            if self.cache.get(key):
+                continue
+            # Leave searches that are already being fetched to whoever is fetching them
+            if not self.cache.mark_pending(key):
+                continue
+            
+            try:
+                requests_made += 1
+                results = self.jira.search_issues(query['jql'], max_results=max_results,
+                                                  raise_on_error=True)
+            except (requests.RequestException, ValueError):
+                # A throttled or failing server shouldn't get more background traffic
+                break
+            else:
+                self.cache.put(key, results)
+                fetched.append(name)
+            finally:
+                self.cache.clear_pending(key)
+        
+        return fetched
@@ -0,0 +1,25 @@
+@decoder
+Feature: Jira Response Decoding
+  As a developer
+  I want search responses decoded quickly
+  So that large result pages don't spend their time in JSON parsing
+
+  @fallback
+  Scenario: Fast and standard library decoders agree
+    Given a search response body with 3 issues
+    When I decode it with the fast decoder
+    And I decode it with the standard library decoder
+    Then both decoders should produce the same result
+
+  @stream
+  Scenario: Decode straight from the raw byte stream
+    Given a search response body with 3 issues
+    When I decode it from the raw stream
+    Then the decoded result should contain 3 issues
+
+  @prune
+  Scenario: Drop fields that were not requested
+    Given a search response body with 3 issues
+    When I decode it keeping only the "summary" field
+    Then each issue should only contain the "summary" field
+    And each issue should not contain "self"
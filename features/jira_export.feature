@@ -0,0 +1,54 @@
+@export
+Feature: Jira Checkpointed Export
+  As a developer
+  I want large exports to be resumable
+  So that a failure halfway through doesn't mean starting again
+
+  Background:
+    Given a Jira search with 25 matching issues
+
+  @complete
+  Scenario: Export all pages
+    When I export the search in pages of 10
+    Then the export file should contain 25 issues
+    And no export checkpoint should remain
+
+  @resume
+  Scenario: Resume an export after a failure
+    Given the search fails on the page starting at 10
+    When I export the search in pages of 10
+    Then the export should have failed
+    And the export file should contain 10 issues
+    And the export checkpoint should resume at 10
+    Given the search no longer fails
+    When I resume the export in pages of 10
+    Then the export file should contain 25 issues
+    And the export file should contain each issue once
+    And no export checkpoint should remain
+
+  @resume @validation
+  Scenario: Refuse to resume a different query
+    Given the search fails on the page starting at 10
+    When I export the search in pages of 10
+    And I resume the export of a different query
+    Then the export should have failed with "different query"
+
+  @resume @validation
+  Scenario: Refuse to resume when the output file is gone
+    Given the search fails on the page starting at 10
+    When I export the search in pages of 10
+    And the export file is deleted
+    And I resume the export in pages of 10
+    Then the export should have failed with "restart the export without --resume"
+
+  @order
+  Scenario: Export pages in a stable order
+    When I export "project = PROJ ORDER BY updated DESC" in pages of 10
+    Then every page should be requested with "project = PROJ ORDER BY created ASC, key ASC"
+
+  @cli @errors
+  Scenario: A failed export exits with an error status
+    Given the search fails on the page starting at 10
+    When I run the export command in pages of 10
+    Then the export command should exit with status 1
+    And the export command should suggest resuming
@@ -0,0 +1,41 @@
+@loadtest
+Feature: Jira Load Testing
+  As a developer
+  I want to replay query workloads with concurrent workers
+  So that I can size concurrency and cache settings before rolling out changes
+
+  @stub
+  Scenario: Load test a local stand-in server
+    Given a local stand-in Jira server
+    When I load test it with 4 workers and 20 requests
+    Then the load test should report 20 requests
+    And the load test should report no errors or throttling
+    And the load test latencies should be ordered
+
+  @stub @throttling
+  Scenario: Report throttled requests
+    Given a local stand-in Jira server that throttles every request
+    When I load test it with 2 workers and 10 requests
+    Then the load test should report a throttle rate of 100%
+
+  @percentiles
+  Scenario: Summarize latencies by percentile
+    Given load test samples with latencies from 1 to 100 ms
+    When I summarize the samples
+    Then the p50 latency should be 50 ms
+    And the p95 latency should be 95 ms
+    And the p99 latency should be 99 ms
+
+  @stub @errors
+  Scenario: Count malformed responses as errors
+    Given a local stand-in Jira server that returns a malformed body
+    When I load test it with 2 workers and 10 requests
+    Then the load test should report 10 requests
+    And the load test should report an error rate of 100%
+
+  @stub @cache
+  Scenario: Serve the workload through the search cache
+    Given a local stand-in Jira server
+    When I load test it through a search cache with 1 worker and 10 requests
+    Then the load test should report 10 requests
+    And the load test should report a cache hit rate of 80%
@@ -0,0 +1,58 @@
+@prefetch
+Feature: Jira Query Prefetch
+  As a developer
+  I want the queries I usually run next fetched ahead of time
+  So that repetitive query sequences are served from the cache
+
+  Background:
+    Given an empty query cache
+    And I have run the queries "all_my_issues, high_priority, recent_updates, all_my_issues, high_priority"
+
+  @predict
+  Scenario: Predict the query most likely to follow
+    When I predict the next 2 queries after "all_my_issues"
+    Then the predicted queries should be "high_priority, recent_updates"
+
+  @budget
+  Scenario: Prefetching stays within the request budget
+    When I warm the cache after "all_my_issues" with a budget of 1 request
+    Then 1 search request should have been made
+    And "high_priority" should be in the cache
+
+  @budget
+  Scenario: Fresh cache entries don't use the request budget
+    Given "high_priority" is already in the cache
+    When I warm the cache after "all_my_issues" with a budget of 1 request
+    Then "recent_updates" should be in the cache
+
+  @in_flight
+  Scenario: Queries already being fetched are left alone
+    Given "high_priority" is being fetched by another process
+    When I warm the cache after "all_my_issues" with a budget of 1 request
+    Then "recent_updates" should be in the cache
+    And "high_priority" should still be marked as being fetched
+
+  @permissions
+  Scenario: Cached results are private to the user
+    When I warm the cache after "all_my_issues" with a budget of 1 request
+    Then the cached "high_priority" results should only be readable by the user
+    And the query usage history should only be readable by the user
+
+  @empty
+  Scenario: Queries with no matches are cached
+    Given the search finds no issues
+    When I warm the cache after "all_my_issues" with a budget of 1 request
+    Then "high_priority" should be in the cache
+
+  @errors
+  Scenario: A throttled prefetch stops without caching
+    Given the search is throttled
+    When I warm the cache after "all_my_issues" with a budget of 2 requests
+    Then 1 search request should have been made
+    And no queries should have been prefetched
+    And "high_priority" should not be in the cache
+
+  @foreground
+  Scenario: Repeating a search within the TTL is served from the cache
+    When I search for "recent_updates" with prefetching twice
+    Then 1 search request should have been made
@@ -0,0 +1,63 @@
+@watch
+Feature: Jira Watch Mode
+  As a developer
+  I want to watch a named query for changes
+  So that I only see what changed since the last poll
+
+  @jql
+  Scenario: Restrict a query to recently updated issues
+    Given the watch query "assignee = currentUser() ORDER BY updated DESC"
+    When I restrict it to issues updated in the last 3 minutes
+    Then the watch query should be '(assignee = currentUser()) AND updated >= "-3m" ORDER BY updated DESC'
+
+  @diff
+  Scenario: Report new and changed issues only
+    Given a previous snapshot with "PROJ-1" in status "Open" updated at "2024-01-01T10:00"
+    And a previous snapshot with "PROJ-2" in status "Open" updated at "2024-01-01T10:00"
+    When a poll returns "PROJ-1" in status "Done" updated at "2024-01-01T10:05"
+    And a poll returns "PROJ-2" in status "Open" updated at "2024-01-01T10:00"
+    And a poll returns "PROJ-3" in status "Open" updated at "2024-01-01T10:06"
+    Then the watch changes should mention "PROJ-1" with "status Open -> Done"
+    And the watch changes should mention "PROJ-3" as new
+    And the watch changes should not mention "PROJ-2"
+
+  @diff @removal
+  Scenario: Report issues that leave the query
+    Given a previous snapshot with "PROJ-1" in status "Open" updated at "2024-01-01T10:00"
+    And a previous snapshot with "PROJ-2" in status "Open" updated at "2024-01-01T10:00"
+    When a poll returns "PROJ-1" in status "Open" updated at "2024-01-01T10:00"
+    And "PROJ-2" was moved to status "Done" at "2024-01-01T10:05" and no longer matches the query
+    Then the watch changes should mention "PROJ-2" as removed with status "Done"
+    And the watch changes should not mention "PROJ-1"
+
+  @poll @pagination
+  Scenario: Seed the snapshot across pages
+    Given a watched query matching 5 issues
+    When I watch it every 60 seconds in pages of 2 for 0 polls
+    Then the watch output should include "Tracking 5 issues"
+
+  @poll @removal
+  Scenario: Report an issue resolved out of the query
+    Given a watched query matching 3 issues
+    And "PROJ-1" will be resolved at 30 seconds
+    When I watch it every 60 seconds in pages of 2 for 1 poll
+    Then the watch output should include "- PROJ-1: Issue 1 (Status: Done)"
+    And the watch output should not include "PROJ-0"
+
+  @poll @removal
+  Scenario: Keep watching after a tracked issue is deleted
+    Given a watched query matching 3 issues
+    And "PROJ-0" will be deleted at 30 seconds
+    And "PROJ-1" will be resolved at 90 seconds
+    When I watch it every 60 seconds in pages of 2 for 2 polls
+    Then the watch output should not include "Poll failed"
+    And the watch output should include "- PROJ-1"
+
+  @poll @errors
+  Scenario: Cover a failed poll's interval in the next poll
+    Given a watched query matching 3 issues
+    And "PROJ-2" will be renamed at 150 seconds
+    And the poll at 300 seconds will fail
+    When I watch it every 300 seconds in pages of 2 for 2 polls
+    Then the watch output should include "Poll failed"
+    And the watch output should include "~ PROJ-2"
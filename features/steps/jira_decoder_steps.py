@@ -0,0 +1,76 @@
+"""
+Step definitions for Jira response decoding tests
+
+This file contains step definitions specific to ResponseDecoder.
+"""
+from behave import given, when, then
+from unittest.mock import MagicMock
+import io
+import json
+
+from core import ResponseDecoder
+
+
+def _response(body):
+    """Build a mocked response holding the given body"""
+    response = MagicMock()
+    response.content = body
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@given('a search response body with {count:d} issues')
+def step_search_body(context, count):
+    """Build a search response body"""
+    issues = [
+        {
+            'id': str(i),
+            'self': f'https://test-jira.example.com/rest/api/2/issue/{i}',
+            'key': f'PROJ-{i}',
+            'fields': {'summary': f'Issue {i}', 'status': {'name': 'Open'}}
+        }
+        for i in range(count)
+    ]
+    context.body = json.dumps({'total': count, 'issues': issues}).encode('utf-8')
+
+@when('I decode it with the fast decoder')
+def step_decode_fast(context):
+    """Decode with orjson where available"""
+    context.fast_result = ResponseDecoder(use_fast=True).decode(_response(context.body))
+
+@when('I decode it with the standard library decoder')
+def step_decode_stdlib(context):
+    """Decode with the json module"""
+    context.stdlib_result = ResponseDecoder(use_fast=False).decode(_response(context.body))
+
+@then('both decoders should produce the same result')
+def step_check_same(context):
+    """Check that both decoders agree"""
+    assert context.fast_result == context.stdlib_result
+
+@when('I decode it from the raw stream')
+def step_decode_stream(context):
+    """Decode from the raw byte stream"""
+    context.result = ResponseDecoder(stream=True).decode(_response(context.body))
+
+@then('the decoded result should contain {count:d} issues')
+def step_check_count(context, count):
+    """Check the number of decoded issues"""
+    assert len(context.result['issues']) == count
+
+@when('I decode it keeping only the "{field}" field')
+def step_decode_pruned(context, field):
+    """Decode with pruning enabled"""
+    context.result = ResponseDecoder(prune=True).decode(_response(context.body), [field])
+
+@then('each issue should only contain the "{field}" field')
+def step_check_fields(context, field):
+    """Check that only the requested field remains"""
+    for issue in context.result['issues']:
+        assert list(issue['fields']) == [field], issue['fields']
+
+@then('each issue should not contain "{key}"')
+def step_check_missing_key(context, key):
+    """Check that an unrequested issue key was dropped"""
+    for issue in context.result['issues']:
+        assert key not in issue, issue
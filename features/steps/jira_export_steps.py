@@ -0,0 +1,147 @@
+"""
+Step definitions for Jira checkpointed export tests
+
+This file contains step definitions specific to IssueExporter.
+"""
+from behave import given, when, then
+from unittest.mock import MagicMock
+import contextlib
+import io
+import json
+import os
+import tempfile
+import types
+
+import requests
+
+from cli import commands
+from core import IssueExporter
+
+JQL = 'project = PROJ'
+
+
+@given('a Jira search with {count:d} matching issues')
+def step_search_with_issues(context, count):
+    """Mock a paginated search"""
+    context.issues = [{'key': f'PROJ-{i}', 'fields': {'summary': f'Issue {i}'}} for i in range(count)]
+    context.fail_at = None
+    
+    def search_issues(jql, max_results=50, fields=None, start_at=0, raise_on_error=False, **kwargs):
+        if start_at == context.fail_at:
+            raise requests.ConnectionError("Connection reset")
+        page = context.issues[start_at:start_at + max_results]
+        return {'startAt': start_at, 'total': len(context.issues), 'issues': page}
+    
+    context.jira = MagicMock()
+    context.jira.search_issues.side_effect = search_issues
+    context.export_dir = tempfile.TemporaryDirectory()
+    context.output_path = os.path.join(context.export_dir.name, 'export.jsonl')
+    context.export_error = None
+
+@given('the search fails on the page starting at {start_at:d}')
+def step_search_fails(context, start_at):
+    """Make one page of the search fail"""
+    context.fail_at = start_at
+
+@given('the search no longer fails')
+def step_search_recovers(context):
+    """Let every page of the search succeed"""
+    context.fail_at = None
+
+def _export(context, page_size, jql=JQL, resume=False):
+    context.exporter = IssueExporter(context.jira, context.output_path, page_size=page_size)
+    context.export_error = None
+    try:
+        context.exporter.export(jql, resume=resume)
+    except (ValueError, requests.RequestException) as e:
+        context.export_error = e
+
+@when('I export the search in pages of {page_size:d}')
+def step_export(context, page_size):
+    """Run an export from the start"""
+    _export(context, page_size)
+
+@when('I resume the export in pages of {page_size:d}')
+def step_resume(context, page_size):
+    """Resume an interrupted export"""
+    _export(context, page_size, resume=True)
+
+@when('I resume the export of a different query')
+def step_resume_different(context):
+    """Resume an interrupted export with another query"""
+    _export(context, 10, jql='project = OTHER', resume=True)
+
+def _exported_keys(context):
+    with open(context.output_path, 'r') as file:
+        return [json.loads(line)['key'] for line in file]
+
+@then('the export file should contain {count:d} issues')
+def step_check_export_count(context, count):
+    """Check the number of exported issues"""
+    assert len(_exported_keys(context)) == count
+
+@then('the export file should contain each issue once')
+def step_check_export_unique(context):
+    """Check that no issue was exported twice"""
+    assert _exported_keys(context) == [issue['key'] for issue in context.issues]
+
+@then('the export should have failed')
+def step_check_failed(context):
+    """Check that the export raised an error"""
+    assert context.export_error is not None
+
+@then('the export should have failed with "{message}"')
+def step_check_failed_with(context, message):
+    """Check that the export raised the expected error"""
+    assert message in str(context.export_error), context.export_error
+
+@then('the export checkpoint should resume at {start_at:d}')
+def step_check_checkpoint(context, start_at):
+    """Check where the checkpoint resumes"""
+    checkpoint = context.exporter.load_checkpoint()
+    assert checkpoint['next_start_at'] == start_at, checkpoint
+    assert checkpoint['offset'] == os.path.getsize(context.output_path)
+
+@then('no export checkpoint should remain')
+def step_check_no_checkpoint(context):
+    """Check that the checkpoint was removed"""
+    assert not os.path.exists(context.exporter.checkpoint_path)
+
+@when('the export file is deleted')
+def step_delete_export(context):
+    """Delete the output file of an interrupted export"""
+    os.remove(context.output_path)
+
+@when('I export "{jql}" in pages of {page_size:d}')
+def step_export_jql(context, jql, page_size):
+    """Run an export of a specific query"""
+    _export(context, page_size, jql=jql)
+
+@then('every page should be requested with "{jql}"')
+def step_check_page_jql(context, jql):
+    """Check the JQL sent for every page"""
+    for call in context.jira.search_issues.call_args_list:
+        assert call.args[0] == jql, call
+
+@when('I run the export command in pages of {page_size:d}')
+def step_run_export_command(context, page_size):
+    """Run the CLI export handler"""
+    args = types.SimpleNamespace(output=context.output_path, page_size=page_size, resume=False)
+    output = io.StringIO()
+    context.exit_status = 0
+    with contextlib.redirect_stdout(output):
+        try:
+            commands.handle_export(context.jira, args, JQL)
+        except SystemExit as e:
+            context.exit_status = e.code
+    context.command_output = output.getvalue()
+
+@then('the export command should exit with status {status:d}')
+def step_check_exit_status(context, status):
+    """Check the export command's exit status"""
+    assert context.exit_status == status, context.exit_status
+
+@then('the export command should suggest resuming')
+def step_check_resume_hint(context):
+    """Check that the export command points at --resume"""
+    assert "rerun with --resume" in context.command_output, context.command_output
@@ -0,0 +1,94 @@
+"""
+Step definitions for Jira load test tests
+
+This file contains step definitions specific to LoadTest and StubJiraServer.
+"""
+from behave import given, when, then
+import tempfile
+
+from core import JiraInterface, LoadTest, SearchCache, StubJiraServer
+
+
+def _start_stub(context, throttle_rate):
+    context.stub = StubJiraServer(latency=0, throttle_rate=throttle_rate)
+    context.stub.start()
+    context.add_cleanup(context.stub.stop)
+
+@given('a local stand-in Jira server')
+def step_stub_server(context):
+    """Start a stand-in server"""
+    _start_stub(context, 0.0)
+
+@given('a local stand-in Jira server that throttles every request')
+def step_throttling_stub_server(context):
+    """Start a stand-in server that answers every search with 429"""
+    _start_stub(context, 1.0)
+
+@given('a local stand-in Jira server that returns a malformed body')
+def step_malformed_stub_server(context):
+    """Start a stand-in server whose search responses aren't JSON"""
+    _start_stub(context, 0.0)
+    context.stub.body = b"<html>"
+
+@when('I load test it with {workers:d} workers and {count:d} requests')
+def step_run_loadtest(context, workers, count):
+    """Run a load test against the stand-in server"""
+    jira = JiraInterface(base_url=context.stub.base_url, api_token='test-token-123')
+    workload = ['project = STUB', 'assignee = currentUser()']
+    context.report = LoadTest(jira, workload, workers=workers).run(count)
+
+@when('I load test it through a search cache with {workers:d} worker and {count:d} requests')
+def step_run_cached_loadtest(context, workers, count):
+    """Run a load test against the stand-in server through a search cache"""
+    cache_dir = tempfile.TemporaryDirectory()
+    context.add_cleanup(cache_dir.cleanup)
+    jira = JiraInterface(base_url=context.stub.base_url, api_token='test-token-123')
+    workload = ['project = STUB', 'assignee = currentUser()']
+    context.report = LoadTest(jira, workload, workers=workers,
+                              cache=SearchCache(cache_dir=cache_dir.name)).run(count)
+
+@then('the load test should report a cache hit rate of {rate:d}%')
+def step_check_cache_hit_rate(context, rate):
+    """Check the cache hit rate"""
+    assert context.report['cache_hit_rate'] == rate / 100, context.report
+
+@then('the load test should report {count:d} requests')
+def step_check_request_count(context, count):
+    """Check the number of requests sent"""
+    assert context.report['requests'] == count
+
+@then('the load test should report no errors or throttling')
+def step_check_no_errors(context):
+    """Check that every request succeeded"""
+    assert context.report['error_rate'] == 0.0, context.report
+    assert context.report['throttle_rate'] == 0.0, context.report
+
+@then('the load test latencies should be ordered')
+def step_check_latency_order(context):
+    """Check that the percentiles are consistent"""
+    assert 0 < context.report['p50'] <= context.report['p95'] <= context.report['p99']
+
+@then('the load test should report a throttle rate of {rate:d}%')
+def step_check_throttle_rate(context, rate):
+    """Check the throttle rate"""
+    assert context.report['throttle_rate'] == rate / 100, context.report
+
+@then('the load test should report an error rate of {rate:d}%')
+def step_check_error_rate(context, rate):
+    """Check the error rate"""
+    assert context.report['error_rate'] == rate / 100, context.report
+
+@given('load test samples with latencies from {low:d} to {high:d} ms')
+def step_samples(context, low, high):
+    """Build load test samples"""
+    context.samples = [{'latency': ms / 1000, 'outcome': 'ok'} for ms in range(low, high + 1)]
+
+@when('I summarize the samples')
+def step_summarize(context):
+    """Summarize the samples"""
+    context.report = LoadTest.summarize(context.samples, duration=1.0)
+
+@then('the p{pct:d} latency should be {ms:d} ms')
+def step_check_percentile(context, pct, ms):
+    """Check a latency percentile"""
+    assert round(context.report[f'p{pct}'] * 1000) == ms, context.report
@@ -0,0 +1,133 @@
+"""
+Step definitions for Jira query prefetch tests
+
+This file contains step definitions specific to query usage tracking and prefetching.
+"""
+from behave import given, when, then
+from unittest.mock import MagicMock, patch
+import contextlib
+import io
+import os
+import tempfile
+import types
+
+import requests
+
+from cli import commands
+from core import SearchCache, QueryUsage, Prefetcher
+
+QUERIES = [
+    {'name': 'all_my_issues', 'jql': 'assignee = currentUser()', 'description': ''},
+    {'name': 'high_priority', 'jql': 'priority = High', 'description': ''},
+    {'name': 'recent_updates', 'jql': 'updated >= -7d', 'description': ''},
+]
+
+
+def _jql(name):
+    return next(query['jql'] for query in QUERIES if query['name'] == name)
+
+
+@given('an empty query cache')
+def step_empty_cache(context):
+    """Set up a cache and usage record in a temporary directory"""
+    context.cache_dir = tempfile.TemporaryDirectory()
+    context.cache = SearchCache(cache_dir=context.cache_dir.name)
+    context.usage = QueryUsage(path=os.path.join(context.cache_dir.name, 'query_usage.json'))
+    context.jira = MagicMock()
+    context.jira.base_url = 'https://test-jira.example.com'
+    context.jira.search_issues.return_value = {'issues': [{'key': 'PROJ-1'}], 'total': 1}
+
+@given('I have run the queries "{names}"')
+def step_run_queries(context, names):
+    """Record a sequence of query runs"""
+    for name in names.split(', '):
+        context.usage.record(name)
+
+@given('"{name}" is already in the cache')
+def step_already_cached(context, name):
+    """Store a fresh cache entry for a query"""
+    key = context.cache.key(context.jira.base_url, _jql(name), 10)
+    context.cache.put(key, {'issues': [], 'total': 0})
+
+@when('I predict the next {count:d} queries after "{name}"')
+def step_predict(context, count, name):
+    """Predict the queries likely to follow"""
+    context.predicted = context.usage.predict(name, count)
+
+@then('the predicted queries should be "{names}"')
+def step_check_predicted(context, names):
+    """Check the predicted queries"""
+    assert context.predicted == names.split(', '), context.predicted
+
+@when('I warm the cache after "{name}" with a budget of {budget:d} request')
+@when('I warm the cache after "{name}" with a budget of {budget:d} requests')
+def step_warm(context, name, budget):
+    """Warm the cache with a request budget"""
+    prefetcher = Prefetcher(context.jira, context.cache, context.usage, budget=budget)
+    context.fetched = prefetcher.warm(name, QUERIES)
+
+@then('{count:d} search request should have been made')
+def step_check_requests(context, count):
+    """Check the number of search requests made"""
+    assert context.jira.search_issues.call_count == count
+
+@then('"{name}" should be in the cache')
+def step_check_cached(context, name):
+    """Check that a query has a fresh cache entry"""
+    assert context.cache.get(context.cache.key(context.jira.base_url, _jql(name), 10))
+
+@given('"{name}" is being fetched by another process')
+def step_in_flight(context, name):
+    """Mark a query as being fetched"""
+    assert context.cache.mark_pending(context.cache.key(context.jira.base_url, _jql(name), 10))
+
+@then('"{name}" should still be marked as being fetched')
+def step_check_in_flight(context, name):
+    """Check that a query's in-flight marker was left in place"""
+    assert context.cache.is_pending(context.cache.key(context.jira.base_url, _jql(name), 10))
+
+@then('the cached "{name}" results should only be readable by the user')
+def step_check_cache_private(context, name):
+    """Check the permissions of a cache entry"""
+    path = context.cache._path(context.cache.key(context.jira.base_url, _jql(name), 10))
+    assert os.stat(path).st_mode & 0o077 == 0, oct(os.stat(path).st_mode)
+
+@then('the query usage history should only be readable by the user')
+def step_check_usage_private(context):
+    """Check the permissions of the usage history"""
+    assert os.stat(context.usage.path).st_mode & 0o077 == 0, oct(os.stat(context.usage.path).st_mode)
+
+@given('the search finds no issues')
+def step_search_empty(context):
+    """Make every search return no issues"""
+    context.jira.search_issues.return_value = {'issues': [], 'total': 0}
+
+@given('the search is throttled')
+def step_search_throttled(context):
+    """Make every search fail with 429 Too Many Requests"""
+    response = MagicMock()
+    response.status_code = 429
+    context.jira.search_issues.side_effect = requests.HTTPError("Search failed with status 429",
+                                                                response=response)
+
+@then('no queries should have been prefetched')
+def step_check_nothing_fetched(context):
+    """Check that no query was reported as prefetched"""
+    assert context.fetched == [], context.fetched
+
+@then('"{name}" should not be in the cache')
+def step_check_not_cached(context, name):
+    """Check that a query has no cache entry"""
+    assert not context.cache.get(context.cache.key(context.jira.base_url, _jql(name), 10))
+
+@when('I search for "{name}" with prefetching twice')
+def step_search_twice(context, name):
+    """Run a foreground search with --prefetch twice"""
+    context.jira.api_token = 'test-token-123'
+    args = types.SimpleNamespace(query=name, jql=None, list_queries=False, limit=10,
+                                 output=None, resume=False, prefetch=True, cache_ttl=300)
+    with patch.dict(os.environ, {'JIRA_CACHE_DIR': context.cache_dir.name}), \
+         patch.object(commands, 'load_queries', return_value=QUERIES), \
+         contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(2):
+            commands.handle_search(context.jira, args)
@@ -0,0 +1,197 @@
+"""
+Step definitions for Jira watch mode tests
+
+This file contains step definitions specific to the watch action.
+"""
+from behave import given, when, then
+from unittest.mock import MagicMock, patch
+import contextlib
+import io
+import re
+import types
+
+import requests
+
+from cli import commands
+from cli.commands import incremental_jql, snapshot_issues, diff_snapshots
+
+
+def _issue(key, status, updated):
+    """Build a minimal search result issue"""
+    return {
+        'key': key,
+        'fields': {'summary': f"Summary of {key}", 'status': {'name': status}, 'updated': updated}
+    }
+
+
+@given('the watch query "{jql}"')
+def step_watch_query(context, jql):
+    """Store the JQL query to watch"""
+    context.watch_jql = jql
+
+@when('I restrict it to issues updated in the last {minutes:d} minutes')
+def step_restrict_query(context, minutes):
+    """Build the incremental JQL query"""
+    context.watch_jql = incremental_jql(context.watch_jql, minutes)
+
+@then("the watch query should be '{expected}'")
+def step_check_watch_query(context, expected):
+    """Check the incremental JQL query"""
+    assert context.watch_jql == expected, f"Unexpected JQL: {context.watch_jql}"
+
+@given('a previous snapshot with "{key}" in status "{status}" updated at "{updated}"')
+def step_previous_snapshot(context, key, status, updated):
+    """Add an issue to the previous snapshot"""
+    context.test_data.setdefault('previous', []).append(_issue(key, status, updated))
+
+def _diff(context):
+    context.changes = diff_snapshots(snapshot_issues(context.test_data['previous']),
+                                     snapshot_issues(context.test_data.get('current', [])),
+                                     snapshot_issues(context.test_data.get('removed', [])))
+
+@when('a poll returns "{key}" in status "{status}" updated at "{updated}"')
+def step_poll_returns(context, key, status, updated):
+    """Add an issue to the current poll and diff against the previous snapshot"""
+    context.test_data.setdefault('current', []).append(_issue(key, status, updated))
+    _diff(context)
+
+@when('"{key}" was moved to status "{status}" at "{updated}" and no longer matches the query')
+def step_issue_left_query(context, key, status, updated):
+    """Mark a tracked issue as updated but no longer matching the query"""
+    context.test_data.setdefault('removed', []).append(_issue(key, status, updated))
+    _diff(context)
+
+@then('the watch changes should mention "{key}" as removed with status "{status}"')
+def step_check_removed(context, key, status):
+    """Check that an issue that left the query is reported"""
+    assert any(f"- {key}:" in line and status in line for line in context.changes), context.changes
+
+@then('the watch changes should mention "{key}" with "{detail}"')
+def step_check_changed(context, key, detail):
+    """Check that a changed issue is reported with the given detail"""
+    assert any(f"~ {key}:" in line and detail in line for line in context.changes), context.changes
+
+@then('the watch changes should mention "{key}" as new')
+def step_check_new(context, key):
+    """Check that a new issue is reported"""
+    assert any(f"+ {key}:" in line for line in context.changes), context.changes
+
+@then('the watch changes should not mention "{key}"')
+def step_check_unchanged(context, key):
+    """Check that an unchanged issue is not reported"""
+    assert not any(f" {key}:" in line for line in context.changes), context.changes
+
+
+class FakeWatchJira:
+    """Stand-in for JiraInterface that answers watch searches from a fake clock"""
+    
+    def __init__(self, count):
+        self.clock = 0
+        self.failing_at = set()
+        self.events = []
+        self.issues = {
+            f'PROJ-{i}': {'summary': f'Issue {i}', 'status': 'Open', 'updated': 0,
+                          'matches': True, 'deleted': False}
+            for i in range(count)
+        }
+    
+    def _result(self, key):
+        issue = self.issues[key]
+        return {'key': key, 'fields': {'summary': issue['summary'],
+                                       'status': {'name': issue['status']},
+                                       'updated': str(issue['updated'])}}
+    
+    def search_issues(self, jql, max_results=50, start_at=0, validate_query=None, **kwargs):
+        if self.clock in self.failing_at:
+            raise requests.ConnectionError("Connection reset")
+        
+        window = re.search(r'updated >= "-(\d+)m"', jql)
+        since = self.clock - int(window.group(1)) * 60 if window else None
+        
+        if jql.startswith('key in'):
+            keys = re.search(r'key in \(([^)]*)\)', jql).group(1).split(', ')
+            if validate_query != 'warn' and any(self.issues[key]['deleted'] for key in keys):
+                response = MagicMock()
+                response.status_code = 400
+                raise requests.HTTPError("Search failed with status 400", response=response)
+            candidates = [key for key in keys if not self.issues[key]['deleted']]
+        else:
+            candidates = [key for key, issue in self.issues.items()
+                          if issue['matches'] and not issue['deleted']]
+        if since is not None:
+            candidates = [key for key in candidates if self.issues[key]['updated'] >= since]
+        
+        page = candidates[start_at:start_at + max_results]
+        return {'total': len(candidates), 'issues': [self._result(key) for key in page]}
+    
+    def sleep(self, seconds):
+        if not self.polls_left:
+            raise KeyboardInterrupt
+        self.polls_left -= 1
+        
+        end = self.clock + seconds
+        for at, apply in sorted(self.events, key=lambda event: event[0]):
+            if self.clock < at <= end:
+                self.clock = at
+                apply(self.issues)
+        self.clock = end
+
+
+def _schedule(context, at, key, change):
+    def apply(issues):
+        issues[key].update(change)
+        issues[key]['updated'] = at
+    context.fake_jira.events.append((at, apply))
+
+@given('a watched query matching {count:d} issues')
+def step_watched_query(context, count):
+    """Set up a fake Jira for watch mode"""
+    context.fake_jira = FakeWatchJira(count)
+
+@given('"{key}" will be resolved at {at:d} seconds')
+def step_will_resolve(context, key, at):
+    """Resolve an issue so it leaves the query"""
+    _schedule(context, at, key, {'status': 'Done', 'matches': False})
+
+@given('"{key}" will be renamed at {at:d} seconds')
+def step_will_rename(context, key, at):
+    """Change an issue's summary"""
+    _schedule(context, at, key, {'summary': f'Renamed {key}'})
+
+@given('"{key}" will be deleted at {at:d} seconds')
+def step_will_delete(context, key, at):
+    """Delete an issue"""
+    _schedule(context, at, key, {'deleted': True})
+
+@given('the poll at {at:d} seconds will fail')
+def step_poll_fails(context, at):
+    """Make every search at the given time fail"""
+    context.fake_jira.failing_at.add(at)
+
+@when('I watch it every {interval:d} seconds in pages of {page_size:d} for {polls:d} poll')
+@when('I watch it every {interval:d} seconds in pages of {page_size:d} for {polls:d} polls')
+def step_run_watch(context, interval, page_size, polls):
+    """Run handle_watch against the fake Jira"""
+    fake = context.fake_jira
+    fake.polls_left = polls
+    args = types.SimpleNamespace(query='all_my_issues', interval=interval, limit=10,
+                                 page_size=page_size)
+    output = io.StringIO()
+    with patch.object(commands, 'load_queries',
+                      return_value=[{'name': 'all_my_issues', 'jql': 'project = PROJ',
+                                     'description': ''}]), \
+         patch.object(commands.time, 'time', side_effect=lambda: fake.clock), \
+         patch.object(commands.time, 'sleep', side_effect=fake.sleep), \
+         contextlib.redirect_stdout(output):
+        commands.handle_watch(fake, args)
+    context.watch_output = output.getvalue()
+
+@then('the watch output should include "{text}"')
+def step_check_output(context, text):
+    """Check the watch output"""
+    assert text in context.watch_output, context.watch_output
+
+@then('the watch output should not include "{text}"')
+def step_check_output_missing(context, text):
+    """Check that the watch output leaves something out"""
+    assert text not in context.watch_output, context.watch_output
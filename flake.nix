@@ -50,6 +50,9 @@
           pyyaml
           python-dotenv
           
+          # Optional speedups
+          orjson
+          
           # Development tools
           pytest
           black